@@ -8,23 +8,36 @@ import os
 import sys
 import logging
 import logging.config
-from configparser import ConfigParser, ExtendedInterpolation
+from configparser import ConfigParser, ExtendedInterpolation, NoOptionError, NoSectionError
+import fnmatch
 import glob
 from pathlib import PurePath
 import json
+import base64
 import random
 import re
-from threading import Thread, Event, get_ident, enumerate as enumerate_threads
-from queue import SimpleQueue, Empty
+from string import Formatter
+from threading import Thread, Event, Lock, get_ident, enumerate as enumerate_threads
+from collections import deque
 import subprocess
+import socket
+import time
+import shutil
 import signal
 import select
 import selectors
-from dataclasses import dataclass
-from urllib.request import urlopen
-from urllib.error import URLError
-from http.client import HTTPResponse
-from typing import ClassVar, Dict, List, Optional, Final
+from dataclasses import dataclass, replace
+from functools import lru_cache, partial
+from operator import attrgetter
+from itertools import islice
+from bisect import bisect_left
+from weakref import WeakSet
+from urllib.parse import SplitResult, unquote, urlsplit, urlunsplit
+from urllib.request import Request, getproxies, proxy_bypass, urlopen
+from http.client import HTTPConnection, HTTPException, HTTPResponse, HTTPSConnection
+from typing import (
+    Callable, ClassVar, Deque, Dict, FrozenSet, List, Match, Optional, Pattern, Tuple, Final
+)
 
 import paho.mqtt.client as mqtt
 
@@ -34,6 +47,10 @@ __build = "develop"
 # Type aliases
 EventParams = Dict[str, str]
 SlideshowMediaSet = List[str]
+DirectoryListing = List[Tuple[str, str, str]]
+DirectoryListings = Dict[str, DirectoryListing]
+SearchFunction = Callable[[EventParams, Dict[str, str], DirectoryListings], SlideshowMediaSet]
+CompiledSearchTerm = Tuple[Tuple[str, SearchFunction], ...]
 
 
 _LOG_CONFIG_FILE: Final[str] = "dynquee.log.conf"
@@ -51,16 +68,106 @@ def getLogger() -> logging.Logger:
 _CONFIG_FILE: Final[str] = "dynquee.ini"
 "Module config file"
 
+_CONFIG_PATH: Final[str] = os.path.join(os.path.dirname(os.path.abspath(__file__)), _CONFIG_FILE)
+"Full path to module config file: resolved once so it doesn't depend on cwd"
 
-def _loadConfig() -> ConfigParser:
-    """Load config file in module directory into ConfigParser instance and return it"""
-    _config: ConfigParser = ConfigParser(
+
+class CachedConfigParser(ConfigParser):
+    """ConfigParser which caches option values after lookup and interpolation.
+        Some options (e.g. search precedence rules) are looked up for every event, but only
+        change when the config file is read: the cache is cleared whenever config is changed.
+    """
+
+    _UNSET: Final[object] = object()
+    "sentinel for `get()` called without fallback"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cache: Dict[Tuple[str, str], Optional[str]] = {}
+        "cache of interpolated option values (None if not defined), keyed by (section, option)"
+        self._listCache: Dict[Tuple[str, str], Tuple[str, ...]] = {}
+        "cache of option values split into words, keyed by (section, option)"
+
+    def _clearCache(self):
+        """Clear cached option values"""
+        self._cache.clear()
+        self._listCache.clear()
+
+    # pylint: disable=redefined-builtin
+    def get(self, section: str, option: str, *, raw=False, vars=None, fallback=_UNSET):
+        """Get an option value for a section (cached unless `raw` or `vars` specified)"""
+        if raw or vars:
+            if fallback is self._UNSET:
+                return super().get(section, option, raw=raw, vars=vars)
+            return super().get(section, option, raw=raw, vars=vars, fallback=fallback)
+        key: Tuple[str, str] = (section, self.optionxform(option))
+        value: Optional[str] = self._cache.get(key, self._UNSET)
+        if value is self._UNSET:
+            try:
+                value = super().get(section, option)
+            except (NoSectionError, NoOptionError):
+                # also cache missing options, e.g. actions with no precedence rule
+                value = None
+            self._cache[key] = value
+        if value is None:
+            if fallback is not self._UNSET:
+                return fallback
+            if not self.has_section(section):
+                raise NoSectionError(section)
+            raise NoOptionError(option, section)
+        return value
+
+    def getlist(
+        self,
+        section: str,
+        option: str,
+        fallback: Optional[Tuple[str, ...]] = None
+    ) -> Optional[Tuple[str, ...]]:
+        """Get an option value split into a tuple of whitespace-separated words (cached)
+            :param fallback: value to return if option is not defined
+            :return: tuple of words, or fallback if option is not defined
+        """
+        key: Tuple[str, str] = (section, self.optionxform(option))
+        words: Optional[Tuple[str, ...]] = self._listCache.get(key)
+        if words is None:
+            value: Optional[str] = self.get(section, option, fallback=None)
+            if value is None:
+                return fallback
+            words = self._listCache[key] = tuple(value.split())
+        return words
+
+    def read(self, filenames, encoding=None) -> List[str]:
+        self._clearCache()
+        return super().read(filenames, encoding)
+
+    def read_file(self, f, source=None):
+        self._clearCache()
+        super().read_file(f, source)
+
+    def set(self, section: str, option: str, value: Optional[str] = None):
+        self._clearCache()
+        super().set(section, option, value)
+
+    def read_dict(self, dictionary, source='<dict>'):
+        self._clearCache()
+        super().read_dict(dictionary, source)
+
+    def remove_option(self, section: str, option: str) -> bool:
+        self._clearCache()
+        return super().remove_option(section, option)
+
+    def remove_section(self, section: str) -> bool:
+        self._clearCache()
+        return super().remove_section(section)
+
+
+def _loadConfig() -> CachedConfigParser:
+    """Load config file in module directory into CachedConfigParser instance and return it"""
+    _config: CachedConfigParser = CachedConfigParser(
         empty_lines_in_values=False,
         interpolation=ExtendedInterpolation()
     )
-    _configFilesRead: List[str] = _config.read(
-        f"{os.path.dirname(__file__)}/{_CONFIG_FILE}",
-    )
+    _configFilesRead: List[str] = _config.read(_CONFIG_PATH)
     logging.info("loaded config file(s): %s", _configFilesRead)
     return _config
 
@@ -71,23 +178,135 @@ class SignalHandler:
     def __init__(self):
         # trap SIGTERM signal to exit program gracefully
         signal.signal(signal.SIGTERM, self._sigReceived)
-        self._events: List[Event] = []
+        # hold weak references so registered events do not outlive their owners
+        self._events: WeakSet[Event] = WeakSet()
+        # pipe written to by the C-level signal handler, whichever thread receives the signal:
+        # a main thread blocked in select() on it wakes at once & runs `_sigReceived()`
+        self._wakeupReadFd: int
+        self._wakeupWriteFd: int
+        # (pipe fds are already non-inheritable; set_wakeup_fd needs a non-blocking write end)
+        self._wakeupReadFd, self._wakeupWriteFd = os.pipe()
+        os.set_blocking(self._wakeupReadFd, False)
+        os.set_blocking(self._wakeupWriteFd, False)
+        try:
+            signal.set_wakeup_fd(self._wakeupWriteFd, warn_on_full_buffer=False)
+        except ValueError:
+            logging.debug("not in main thread: signal wakeup fd not set")
 
     def addEvent(self, event: Event):
-        """Register event with signal handler"""
-        self._events.append(event)
+        """Register event with signal handler (events already registered are ignored)"""
+        self._events.add(event)
 
     def removeEvent(self, event: Event):
-        """Remove event registration"""
-        self._events.remove(event)
+        """Remove event registration (if registered)"""
+        self._events.discard(event)
+
+    def fileno(self) -> int:
+        """Return the FD number of the read side of the signal wakeup pipe; allows this
+            object to be used with select.select()
+        """
+        return self._wakeupReadFd
+
+    def clearWakeup(self):
+        """Discard bytes written to the signal wakeup pipe"""
+        try:
+            while os.read(self._wakeupReadFd, 512):
+                pass
+        except BlockingIOError:
+            pass
 
     def _sigReceived(self, signum: int, _stackFrame):
         """Called when SIGTERM received: set exit flags on registered Event objects"""
         log.info('received signal %s', signal.Signals(signum).name)
-        for event in self._events:
+        for event in list(self._events):
             event.set()
 
 
+class WaitableEvent:
+    """Provides an abstract object that can be used to resume select loops with
+    indefinite waits from another thread or process. Mimics the standard
+    threading.Event interface.
+
+    Code by Radek Lát: see https://lat.sk/2015/02/multiple-event-waiting-python-3/
+    """
+
+    def __init__(self):
+        self._readFd: int
+        self._writeFd: int
+        self._isEventFd: bool = hasattr(os, 'eventfd')
+        "True if using an eventfd, False if using a pipe"
+        if self._isEventFd:
+            # eventfd (Linux, Python 3.10+): a single fd holding a counter which is
+            # atomically incremented by set() and reset to zero by clear()
+            self._readFd = self._writeFd = os.eventfd(0, os.EFD_NONBLOCK | os.EFD_CLOEXEC)
+        else:
+            # create a pipe between read & write file descriptors
+            self._readFd, self._writeFd = os.pipe()
+            os.set_blocking(self._readFd, False)
+            os.set_blocking(self._writeFd, False)
+
+    def wait(self, timeout=None) -> bool:
+        """Wait for event to occur (max timeout ms).
+            @return bool True if event has occurred before timeout
+        """
+        rfds, _wfds, _efds = select.select([self._readFd], [], [], timeout)
+        return self._readFd in rfds
+
+    def is_set(self) -> bool: # pylint: disable = invalid-name
+        """Test if event flag is set"""
+        return self.wait(0)
+
+    def clear(self) -> None:
+        """Clear event flag"""
+        try:
+            # reads (and resets) the eventfd counter, or drains the pipe
+            os.read(self._readFd, 8)
+        except BlockingIOError:
+            pass
+
+    def set(self) -> None:
+        """Set event flag"""
+        if self._isEventFd:
+            os.eventfd_write(self._writeFd, 1)
+        elif not self.is_set():
+            os.write(self._writeFd, b'1')
+
+    def fileno(self) -> int:
+        """Return the FD number of the read side of the pipe; allows this object to
+        be used with select.select().
+        """
+        return self._readFd
+
+    def __del__(self):
+        os.close(self._readFd)
+        if self._writeFd != self._readFd:
+            os.close(self._writeFd)
+
+
+def _waitForProcess(process: subprocess.Popen, timeout: float) -> int:
+    """Wait for a subprocess to exit. Like `Popen.wait(timeout)`, which sleeps and polls
+        repeatedly until the timeout, but uses a pidfd (Linux 5.3+) which becomes readable
+        as soon as the process exits. Falls back to `Popen.wait()` if pidfd is not supported.
+        :param process: subprocess to wait for
+        :param timeout: maximum time to wait (seconds)
+        :raises subprocess.TimeoutExpired: if process has not exited within timeout
+        :return: process return code
+    """
+    if process.poll() is not None:
+        return process.returncode
+    try:
+        pidfd: int = os.pidfd_open(process.pid)
+    except (AttributeError, OSError):
+        return process.wait(timeout)
+    try:
+        if not select.select([pidfd], [], [], timeout)[0]:
+            raise subprocess.TimeoutExpired(process.args, timeout)
+    finally:
+        os.close(pidfd)
+    # process has exited: reap it without blocking
+    return process.wait()
+
+
 class MQTTSubscriber:
     """MQTT subscriber: handles connection to broker to receive events from
         EmulationStation and read event params from event file.
@@ -107,16 +326,46 @@ class MQTTSubscriber:
     _CONFIG_SECTION: Final[str] = 'recalbox'
     "config file section for MQTTSubscriber"
 
+    _STATE_FILE_RACY_TIME_NS: Final[int] = 100_000_000
+    "ES state file modified less than this many ns before being read is always re-read"
+
+    _RECONNECT_DELAY: Final[float] = 5.0
+    "how long to wait between attempts to reconnect to the MQTT broker (seconds)"
+
+    _HTTP_TIMEOUT: Final[float] = 5.0
+    "how long to wait for the remote host to respond to an ES state request (seconds)"
+
     def __init__(self):
         self._client: mqtt.Client = mqtt.Client()
         # log mqtt.Client messages to module logger
         self._client.enable_logger(logger=log)
-        # queue to hold incoming messages
-        self._messageQueue: SimpleQueue[mqtt.MQTTMessage] = SimpleQueue()
+        self._keepalive: int = 60
+        "MQTT keepalive interval (seconds)"
+        self._coalesceTime: float = config.getfloat(
+            self._CONFIG_SECTION,
+            'event_coalesce_time',
+            fallback=0
+        )
+        "how long to wait for further events to coalesce after receiving an event (seconds)"
+        # queue to hold payloads of incoming messages: only accessed by the thread running
+        # the network loop (see `_runNetworkLoop()`) so needs no locking
+        self._messageQueue: Deque[str] = deque()
         # event to signal exit of blocking getEvent() method
-        self._exitEvent = Event()
+        self._exitEvent: WaitableEvent = WaitableEvent()
         _signalHander.addEvent(self._exitEvent)
+        # selector to wait for either network traffic or an exit signal without polling
+        self._selector: selectors.BaseSelector = selectors.DefaultSelector()
+        self._selector.register(self._exitEvent, selectors.EVENT_READ)
+        self._selector.register(_signalHander, selectors.EVENT_READ)
+        # cache of local ES state file contents
+        self._stateFileVersion: Optional[Tuple[int, int]] = None
+        "(modification time, size) of local ES state file when last read, or None to force a read"
+        self._stateFileParams: EventParams = {}
+        "event params last read from local ES state file"
+        self._httpConnection: Optional[HTTPConnection] = None
+        "connection to remote host kept open between ES state requests, or None if not connected"
         # define callbacks
+        self._client.on_socket_open = self._onSocketOpen
         self._client.on_connect = self._onConnect
         self._client.on_disconnect = self._onDisconnect
         self._client.on_message = self._onMessage
@@ -124,6 +373,7 @@ class MQTTSubscriber:
     def __del__(self):
         # disconnect from broker before exit
         self._client.disconnect()
+        self._closeHttpConnection()
         # de-register from signal handler
         _signalHander.removeEvent(self._exitEvent)
 
@@ -131,70 +381,171 @@ class MQTTSubscriber:
         """Connect to the MQTT broker"""
         host: str = config.get(self._CONFIG_SECTION, 'host')
         port: int = config.getint(self._CONFIG_SECTION, 'port')
-        keepalive: int = config.getint(self._CONFIG_SECTION, 'keepalive', fallback=60)
-        log.info("connecting to MQTT broker host=%s port=%d keepalive=%d", host, port, keepalive)
+        self._keepalive = config.getint(self._CONFIG_SECTION, 'keepalive', fallback=60)
+        log.info(
+            "connecting to MQTT broker host=%s port=%d keepalive=%d", host, port, self._keepalive
+        )
         self._client.connect(
             host=host,
             port=port,
-            keepalive=keepalive,
+            keepalive=self._keepalive,
             *args
         )
-        self._client.loop_start()
+        # Note: no loop_start() network thread: network traffic is processed by
+        # _runNetworkLoop() in the thread calling getEvent()
 
     def stop(self):
         """Disconnect from the MQTT broker"""
         self._client.disconnect()
 
+    def _onSocketOpen(self, _client, _userdata, sock: socket.socket):
+        """Disable Nagle's algorithm on new broker connection before MQTT connect is sent,
+            so small packets (subscribe, keepalive pings) are not delayed
+        """
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError as err:
+            log.debug("could not set TCP_NODELAY on MQTT socket: %s", err)
+
     def _onConnect(self, _client, _user, _flags, rc: int):
         topic: str = config.get(self._CONFIG_SECTION, 'topic')
-        self._client.subscribe(topic)
+        # QoS 0: ES events are only hints to re-read the state file and are superseded by
+        # the next event, so acknowledging each one would only add latency
+        self._client.subscribe(topic, qos=0)
         log.info("connected to MQTT broker rc=%d topic=%s", rc, topic)
 
     def _onDisconnect(self, _client, _userdata, rc: int):
         log.info("disconnected from MQTT broker rc=%d", rc)
-        self._client.loop_stop()
 
     def _onMessage(self, _client, _userdata, message: mqtt.MQTTMessage):
-        """Add incoming message to message queue"""
-        log.debug("message topic=%s payload=%s", str(message.topic), str(message.payload))
-        self._messageQueue.put(message)
+        """Add decoded payload of incoming message to message queue"""
+        log.debug("message topic=%s payload=%s", message.topic, message.payload)
+        self._messageQueue.append(message.payload.decode("utf-8", "replace"))
 
-    def getEvent(self, checkInterval: float = 5.0) -> Optional[str]:
+    def _reconnect(self):
+        """Try to reconnect to the MQTT broker after the connection was lost,
+            waiting before returning if the attempt fails
+        """
+        log.info("reconnecting to MQTT broker")
+        try:
+            self._client.reconnect()
+        except OSError as err:
+            log.warning("failed to reconnect to MQTT broker: %s", err)
+            self._exitEvent.wait(self._RECONNECT_DELAY)
+
+    def _runNetworkLoop(self, timeout: Optional[float]) -> bool:
+        """Wait for network traffic to or from the MQTT broker (or an exit signal) and process it.
+            Replaces paho's loop_start() thread: incoming messages are queued by `_onMessage()`
+            in the calling thread, so there is no hand-off between threads for each message.
+            :param timeout: maximum time to wait (seconds), or 0 to process waiting traffic only
+            :return: True if any network traffic was processed, False otherwise
+        """
+        sock: Optional[socket.socket] = self._client.socket()
+        if sock is None:
+            return False
+        events: int = selectors.EVENT_READ
+        if self._client.want_write():
+            events |= selectors.EVENT_WRITE
+        self._selector.register(sock, events)
+        try:
+            ready: List[Tuple[selectors.SelectorKey, int]] = self._selector.select(timeout)
+        finally:
+            self._selector.unregister(sock)
+        processed: bool = False
+        for key, mask in ready:
+            if key.fileobj is sock:
+                if mask & selectors.EVENT_READ:
+                    self._client.loop_read()
+                if mask & selectors.EVENT_WRITE:
+                    self._client.loop_write()
+                processed = True
+            elif key.fileobj is _signalHander:
+                # signal handler has run (or will run on return to interpreter): it sets _exitEvent
+                _signalHander.clearWakeup()
+        # send keepalive ping if due
+        self._client.loop_misc()
+        return processed
+
+    def getEvent(self) -> Optional[str]:
         """Read an event from the message queue. Blocks until data is
             received or interrupted by an exit signal.
-            :param checkInterval: how often to check if exit was requested (None = never check)
             :return: an event from the MQTT broker, or None if exit signal received while waiting
         """
         while not self._exitEvent.is_set():
-            try:
-                return self._messageQueue.get(timeout=checkInterval).payload.decode("utf-8")
-            except Empty:
-                pass
+            if self._messageQueue:
+                return self._messageQueue.popleft()
+            if self._client.socket() is None:
+                self._reconnect()
+                continue
+            # sleep until network traffic arrives or exit is signalled;
+            # wake up in time to send a keepalive ping if no traffic
+            # (keepalive of 0 disables pings: wait indefinitely)
+            self._runNetworkLoop(self._keepalive / 2 if self._keepalive > 0 else None)
         return None
 
+    def getQueuedEvents(self) -> List[str]:
+        """Read all events waiting in the message queue, first waiting up to
+            `event_coalesce_time` seconds (from config file) for more events to arrive
+            :return: list of events in the order received, or [] if none are waiting
+        """
+        # pick up any messages which arrived while the last event was being handled,
+        # or arrive within the coalesce time e.g. while scrolling through a game list
+        deadline: float = time.monotonic() + self._coalesceTime
+        while not self._exitEvent.is_set() and self._client.socket() is not None:
+            remaining: float = max(deadline - time.monotonic(), 0)
+            if not self._runNetworkLoop(remaining) and remaining == 0:
+                break
+        events: List[str] = list(self._messageQueue)
+        self._messageQueue.clear()
+        return events
+
     def getEventParams(self) -> EventParams:
         """Read event params from ES state file (either local or remote), stripping any CR chars
             :return: a dict mapping param names to their values
         """
-        rawState: List[str]
+        params: EventParams
         if config.getboolean(self._CONFIG_SECTION, 'is_local', fallback=True):
-            rawState = self._getEventParamsFromLocalhost()
+            params = self._getEventParamsFromLocalhost()
         else:
-            rawState = self._getEventParamsFromRemote()
-        params: EventParams = {}
-        for line in rawState:
-            # split line on first = character
-            key, value = line.strip().split('=', 1)
-            params[key] = value
+            params = self._parseEventParams(self._getEventParamsFromRemote())
         log.debug("params=%s", params)
         return params
 
-    def _getEventParamsFromLocalhost(self) -> List[str]:
-        """Read event params from local file.
-            :return: contents of ES state file as a list of str
+    @staticmethod
+    def _parseEventParams(rawState: List[str]) -> EventParams:
+        """Parse lines of the ES state file into event params
+            :param rawState: contents of ES state file as a list of str
+            :return: a dict mapping param names to their values
+        """
+        # split each line on first = character, skipping lines without one
+        return {
+            key: value
+            for key, sep, value in (line.strip().partition('=') for line in rawState)
+            if sep
+        }
+
+    def _getEventParamsFromLocalhost(self) -> EventParams:
+        """Read event params from local file. The file is only re-read if its
+            modification time or size has changed since it was last read.
+            :return: a dict mapping param names to their values
         """
-        with open(config.get(self._CONFIG_SECTION, 'es_state_local_file'), encoding="utf8") as esf:
-            return esf.readlines()
+        path: str = config.get(self._CONFIG_SECTION, 'es_state_local_file')
+        stat: os.stat_result = os.stat(path)
+        fileVersion: Tuple[int, int] = (stat.st_mtime_ns, stat.st_size)
+        if fileVersion != self._stateFileVersion:
+            with open(path, encoding="utf8") as esf:
+                self._stateFileParams = self._parseEventParams(esf.read().splitlines())
+            # File timestamps have limited resolution, so a file modified very recently
+            # could be modified again without its timestamp changing: don't trust
+            # the cache for it
+            recentlyModified: bool = (
+                time.time_ns() - stat.st_mtime_ns < self._STATE_FILE_RACY_TIME_NS
+            )
+            self._stateFileVersion = None if recentlyModified else fileVersion
+        else:
+            log.debug("ES state file unchanged: using cached params")
+        # return a copy as caller may modify params
+        return self._stateFileParams.copy()
 
     def _getEventParamsFromRemote(self) -> List[str]:
         """Read event params from ES State file on a remote host.
@@ -205,17 +556,74 @@ class MQTTSubscriber:
         """
         url: str = config.get(self._CONFIG_SECTION, 'es_state_remote_url')
         try:
-            response: HTTPResponse
-            with urlopen(url) as response:
-                log.debug("HTTP response status=%s reason=%s", response.status, response.reason)
-                jsonResponse: dict = json.load(response)
-                log.debug("remote ES state JSON=%s", jsonResponse)
-                # retrieve relevant JSON property & split into lines
-                return jsonResponse["data"]["readFile"].split('\r\n')
-        except (URLError, json.decoder.JSONDecodeError, KeyError):
+            jsonResponse: dict
+            if self._httpConnection is None:
+                jsonResponse = self._getRemoteJson(url)
+            else:
+                try:
+                    jsonResponse = self._getRemoteJson(url)
+                except ConnectionError:
+                    # remote host may have closed the idle connection: retry on a new one
+                    log.debug("ES state request on existing connection failed: reconnecting")
+                    self._closeHttpConnection()
+                    jsonResponse = self._getRemoteJson(url)
+            log.debug("remote ES state JSON=%s", jsonResponse)
+            # retrieve relevant JSON property & split into lines
+            return jsonResponse["data"]["readFile"].split('\r\n')
+        except (HTTPException, OSError, json.decoder.JSONDecodeError, KeyError):
+            self._closeHttpConnection()
             log.error("failed to get ES state from remote host: url=%s", url, exc_info=True)
             return []
 
+    def _getRemoteJson(self, url: str) -> dict:
+        """Send a GET request to the remote host and decode its JSON response.
+            The HTTP connection is kept open for the next request, saving a TCP
+            handshake per event. If a proxy is configured for the URL (e.g. `http_proxy`
+            environment variable), the request is sent with urllib via the proxy instead.
+            Credentials in the URL are sent using HTTP basic authentication.
+            :param url: URL to request
+            :raises HTTPException: if the response status is not 200 OK
+            :return: decoded JSON response
+        """
+        urlParts: SplitResult = urlsplit(url)
+        # host & port without any credentials
+        hostPort: str = urlParts.netloc.rpartition('@')[2]
+        headers: Dict[str, str] = {}
+        if urlParts.username is not None:
+            credentials: str = f"{unquote(urlParts.username)}:{unquote(urlParts.password or '')}"
+            headers['Authorization'] = (
+                f"Basic {base64.b64encode(credentials.encode('utf-8')).decode('ascii')}"
+            )
+        response: HTTPResponse
+        if urlParts.scheme in getproxies() and not proxy_bypass(urlParts.hostname or ''):
+            request: Request = Request(
+                urlunsplit(urlParts._replace(netloc=hostPort)),
+                headers=headers
+            )
+            with urlopen(request, timeout=self._HTTP_TIMEOUT) as response:
+                log.debug("HTTP response status=%s reason=%s", response.status, response.reason)
+                return json.load(response)
+        if self._httpConnection is None:
+            connectionClass = HTTPSConnection if urlParts.scheme == 'https' else HTTPConnection
+            self._httpConnection = connectionClass(hostPort, timeout=self._HTTP_TIMEOUT)
+        path: str = urlParts.path or '/'
+        if urlParts.query:
+            path += f"?{urlParts.query}"
+        self._httpConnection.request('GET', path, headers=headers)
+        response = self._httpConnection.getresponse()
+        log.debug("HTTP response status=%s reason=%s", response.status, response.reason)
+        # read whole body so the connection can be reused
+        body: bytes = response.read()
+        if response.status != 200:
+            raise HTTPException(f"HTTP status {response.status} {response.reason}")
+        return json.loads(body)
+
+    def _closeHttpConnection(self):
+        """Close connection to remote host (if open)"""
+        if self._httpConnection is not None:
+            self._httpConnection.close()
+            self._httpConnection = None
+
 
 class MediaManager:
     """Locates appropriate media files for an EmulationStation action using ordered search
@@ -240,89 +648,283 @@ class MediaManager:
     }
     "glob patterns to find media files for each search term"
 
+    _GLOB_TOKEN_RE: Final[Pattern[str]] = re.compile(r'\[([*?[])\]|[*?]')
+    "matches an escaped character (captured) or a wildcard in a glob pattern"
+
+    _DIR_CACHE_RACY_TIME_NS: Final[int] = 2_000_000_000
+    "directory modified less than this many ns before being listed is always re-read"
+
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _getExtensionSet(extensions: Tuple[str, ...]) -> FrozenSet[str]:
+        """Convert a tuple of file extensions to a set of lower case extensions
+            (cached: called for every media file shown)
+        """
+        return frozenset(ext.lower() for ext in extensions)
+
     @classmethod
     def isVideo(cls, filePath: str) -> bool:
-        """Test if specified file is a video file
+        """Test if specified file is a video file (extension is matched case-insensitively)
             :return: True if file is a video file, False otherwise
         """
-        for ext in config.get(cls._CONFIG_SECTION, 'video_file_extensions').split():
-            if filePath.endswith(ext):
-                return True
-        return False
+        dot: int = filePath.rfind('.')
+        return dot >= 0 and filePath[dot:].lower() in cls._getExtensionSet(
+            config.getlist(cls._CONFIG_SECTION, 'video_file_extensions')
+        )
 
-    @classmethod
-    def _caseInsensitiveGlobPattern(cls, pattern: str) -> str:
-        """Replace a simple glob pattern with its case insensitive equivalent
-            e.g. 'cat' => '[cC][aA][tT]'
+    def __init__(self):
+        self._mediaPath: str = config.get(self._CONFIG_SECTION, 'media_path')
+        "path where marquee media files are located"
+        self._defaultImagePath: str = (
+            f"{self._mediaPath}/{config.get(self._CONFIG_SECTION, 'default_image')}"
+        )
+        "path to image to show if no other media files are found"
+        # check once at startup rather than on every event which falls back to it
+        if not os.path.isfile(self._defaultImagePath):
+            log.warning("default image %s not found: check config file", self._defaultImagePath)
+        self._dirCache: Dict[str, Tuple[int, DirectoryListing]] = {}
+        "directory listings from previous searches with their directories' mtime, keyed by path"
+        # build dispatch table of search functions once rather than testing
+        # each search term against every kind of term for every event
+        self._searchFunctions: Dict[str, SearchFunction] = {
+            searchTerm: partial(
+                self._getMediaForGlobPattern,
+                globPattern,
+                self._getPatternFieldNames(globPattern)
+            )
+            for searchTerm, globPattern in self._GLOB_PATTERNS.items()
+        }
+        "maps each valid search term to a function which locates its media"
+        self._searchFunctions['scraped'] = self._getScrapedMedia
+        self._compiledRules: Dict[str, Tuple[CompiledSearchTerm, ...]] = {}
+        "precedence rules already resolved to search functions, keyed by action"
+        self._warmDirectoryCache()
+
+    def _warmDirectoryCache(self):
+        """Read the media directory and each of its subdirectories into the directory cache
+            at startup, so the first events only need to check modification times
+            rather than reading every directory they search
         """
+        listings: DirectoryListings = {}
+        for _lowerName, _name, path in self._listDirectory(self._mediaPath, listings):
+            self._listDirectory(path, listings)
+        log.debug("cached listings of %d directories", len(self._dirCache))
+
+    @staticmethod
+    def _getPatternFieldNames(pattern: str) -> Tuple[str, ...]:
+        """Get the names of the fields to be inserted into a glob pattern
+            :param pattern: a glob pattern from `_GLOB_PATTERNS`
+            :return: tuple of field names, e.g. `('publisher',)`
+        """
+        return tuple(
+            fieldName for _, fieldName, _, _ in Formatter().parse(pattern)
+            if fieldName is not None
+        )
 
-        def _upperOrLowerChar(char: str) -> str:
-            """Replace an alpha character with its upper & lower case alternative
-                e.g. 'a' => '[aA]'
-            """
-            return f"[{char.lower()}{char.upper()}]" if char.isalpha() else char
-
-        # escape opening square bracket in filename
-        pattern = pattern.replace('[', '[[]')
-        return ''.join(_upperOrLowerChar(char) for char in pattern)
-
-    def _getMediaMatching(self, globPattern: str) -> SlideshowMediaSet:
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _getComponentMatcher(component: str) -> Tuple[str, Callable[[str], bool]]:
+        """Build a case insensitive matcher for a single path component of a glob pattern
+            (cached: the same patterns recur for every event).
+            Only `*` and `?` are wildcards; `[*]`, `[?]` and `[[]` (as produced by
+            `glob.escape()`) match the character literally.
+            :return: tuple of (the literal lower case prefix of every matching name, a function
+              which tests if a lower case file or directory name matches the component)
+        """
+        lowerComponent: str = component.lower()
+        # find first wildcard that isn't escaped
+        wildcard: Optional[Match[str]] = next(
+            (
+                match for match in MediaManager._GLOB_TOKEN_RE.finditer(lowerComponent)
+                if match.group(1) is None
+            ),
+            None
+        )
+        if wildcard is None:
+            # literal name e.g. `publisher`: compare names directly
+            literal: str = MediaManager._GLOB_TOKEN_RE.sub(r'\1', lowerComponent)
+            return literal, lambda name: name == literal
+        prefix: str = MediaManager._GLOB_TOKEN_RE.sub(r'\1', lowerComponent[:wildcard.start()])
+        # literal basename with any extension e.g. `atari.*`: a prefix test is enough
+        if wildcard.start() == len(lowerComponent) - 1 and lowerComponent.endswith('.*'):
+            return prefix, lambda name: True
+        # anything else: compile to a regex
+        regex: Pattern[str] = re.compile(fnmatch.translate(component), re.IGNORECASE)
+        return prefix, lambda name: regex.match(name) is not None
+
+    def _listDirectory(self, dirPath: str, listings: DirectoryListings) -> DirectoryListing:
+        """List the contents of a directory, reusing a listing already read if available.
+            Listings are kept between events and only re-read when the directory's
+            modification time changes.
+            :param dirPath: path to directory
+            :param listings: directory listings already read: updated with this directory
+            :return: list of (lower case name, name, path) tuples sorted by lower case name,
+              or [] if dirPath is not a directory
+        """
+        if dirPath not in listings:
+            try:
+                mtime: int = os.stat(dirPath).st_mtime_ns
+                cached: Optional[Tuple[int, DirectoryListing]] = self._dirCache.get(dirPath)
+                if cached is not None and cached[0] == mtime:
+                    listings[dirPath] = cached[1]
+                else:
+                    with os.scandir(dirPath) as entries:
+                        listings[dirPath] = sorted(
+                            (entry.name.lower(), entry.name, entry.path) for entry in entries
+                        )
+                    # don't keep listing of a directory modified too recently: a change
+                    # within the filesystem's timestamp resolution would not alter its mtime
+                    if time.time_ns() - mtime >= self._DIR_CACHE_RACY_TIME_NS:
+                        self._dirCache[dirPath] = (mtime, listings[dirPath])
+            except OSError:
+                # directory does not exist or is not a directory
+                listings[dirPath] = []
+                self._dirCache.pop(dirPath, None)
+        return listings[dirPath]
+
+    def _getMediaMatching(
+        self,
+        globPattern: str,
+        listings: Optional[DirectoryListings] = None
+    ) -> SlideshowMediaSet:
         """Search for media files matching globPattern within media directory.
             File & directory names are searched case-insensitively.
+            :param listings: directory listings already read during this search (if any),
+              so each directory is only read once when searching for several patterns
             :return: list of paths of matching files, or []
         """
-        globPattern = self._caseInsensitiveGlobPattern(globPattern)
         log.debug("searching for media files matching %s", globPattern)
-        files: SlideshowMediaSet = glob.glob(
-            f"{config.get(self._CONFIG_SECTION, 'media_path')}/{globPattern}"
-        )
+        if listings is None:
+            listings = {}
+        # walk the media directory one path component at a time;
+        # like glob, wildcards do not match hidden files
+        files: SlideshowMediaSet = [self._mediaPath]
+        for component in globPattern.split('/'):
+            prefix: str
+            isMatch: Callable[[str], bool]
+            prefix, isMatch = self._getComponentMatcher(component)
+            matchHidden: bool = component.startswith('.')
+            matches: SlideshowMediaSet = []
+            for dirPath in files:
+                entries: DirectoryListing = self._listDirectory(dirPath, listings)
+                # listing is sorted: only look at the range of names starting with the
+                # component's literal prefix e.g. `sonic.` in a large rom directory
+                for lowerName, name, path in islice(
+                    entries, bisect_left(entries, (prefix,)), None
+                ):
+                    if not lowerName.startswith(prefix):
+                        break
+                    if (matchHidden or not name.startswith('.')) and isMatch(lowerName):
+                        matches.append(path)
+            files = matches
         log.debug("found %d files: %s", len(files), files)
         return files
 
-    def _getPrecedenceRule(self, action: str) -> List[str]:
+    def _getPrecedenceRule(self, action: str) -> Tuple[str, ...]:
         """Get precedence rule for this action from config file
             :return: precedence rule: an ordered list of search terms
         """
-        precedence: List[str] = config.get(
-            self._CONFIG_SECTION,
-            action,
+        precedence: Optional[Tuple[str, ...]] = config.getlist(self._CONFIG_SECTION, action)
+        if precedence is None:
             # if no rule defined for this action, use the default rule
-            fallback=config.get(self._CONFIG_SECTION, 'default')
-        ).split()
+            precedence = config.getlist(self._CONFIG_SECTION, 'default')
         log.debug("action=%s; search precedence=%s", action, precedence)
         return precedence
 
-    def _getMediaForSearchTerm(self, searchTerm: str, evParams: EventParams) -> SlideshowMediaSet:
-        """Locate media matching a single component of a search rule. See config file
-            for list of valid search terms.
-            :param searchTerm: the search term
+    def _getCompiledRule(self, action: str) -> Tuple[CompiledSearchTerm, ...]:
+        """Get precedence rule for this action resolved to search functions, so each event
+            doesn't have to split and look up every search term again (cached per action)
+            :return: tuple of search terms, each a tuple of (subterm, search function) pairs;
+              `blank` is an empty tuple. Terms with no recognised subterms are left out.
+        """
+        compiledRule: Optional[Tuple[CompiledSearchTerm, ...]] = self._compiledRules.get(action)
+        if compiledRule is None:
+            compiledTerms: List[CompiledSearchTerm] = []
+            for searchTerm in self._getPrecedenceRule(action):
+                if searchTerm == 'blank':
+                    compiledTerms.append(())
+                    continue
+                # split complex terms e.g. `rom+scraped+publisher` into subterms
+                subTerms: List[Tuple[str, SearchFunction]] = []
+                for subTerm in searchTerm.split('+'):
+                    searchFunction: Optional[SearchFunction] = self._searchFunctions.get(subTerm)
+                    # skip unrecognised search terms
+                    if searchFunction is None:
+                        log.warning("skipped unrecognised search term '%s'", subTerm)
+                        continue
+                    subTerms.append((subTerm, searchFunction))
+                if subTerms:
+                    compiledTerms.append(tuple(subTerms))
+            compiledRule = self._compiledRules[action] = tuple(compiledTerms)
+        return compiledRule
+
+    @classmethod
+    def _getPatternFields(cls, evParams: EventParams) -> Dict[str, str]:
+        """Get the values to insert into search terms' glob patterns for an event
             :param evParams: a dict of event parameters
-            :return: list of paths to media files, or [] if precedence rule is `blank`
+            :return: a dict mapping glob pattern field names to their values, with glob
+              wildcards escaped so e.g. `*` in a game name only matches `*`
         """
-        # if search term is `scraped` just return scraped image path (if set)
-        if searchTerm == 'scraped':
-            imagePath: str = evParams.get('ImagePath', '')
-            log.debug("searchTerm=scraped ImagePath=%s", imagePath)
-            if imagePath == '':
-                return []
-            return [imagePath]
-        # skip unrecognised search terms
-        if searchTerm not in self._GLOB_PATTERNS:
-            log.warning("skipped unrecognised search term '%s'", searchTerm)
-            return []
         # get game filename without directory and extension (only last extension removed)
-        gameBasename: str = os.path.splitext(os.path.basename(evParams.get('GamePath', '')))[0]
+        gamePath: str = evParams.get('GamePath', '')
+        gameBasename: str = gamePath[gamePath.rfind('/') + 1:]
+        dot: int = gameBasename.rfind('.')
+        if dot > 0:
+            gameBasename = gameBasename[:dot]
         log.debug("gameBasename=%s", gameBasename)
+        return {
+            'gameBasename': glob.escape(gameBasename),
+            'systemId': glob.escape(evParams.get('SystemId', '').lower()),
+            'publisher': glob.escape(evParams.get('Publisher', '').lower()),
+            'genre': glob.escape(evParams.get('Genre', '').lower()),
+        }
+
+    @staticmethod
+    def _getScrapedMedia(
+        evParams: EventParams,
+        _patternFields: Dict[str, str],
+        _listings: DirectoryListings
+    ) -> SlideshowMediaSet:
+        """Search function for `scraped` search term: return scraped image path (if set and
+            the file exists)
+            :param evParams: a dict of event parameters
+            :return: list containing path to scraped image, or [] if not set or missing
+        """
+        imagePath: str = evParams.get('ImagePath', '')
+        log.debug("searchTerm=scraped ImagePath=%s", imagePath)
+        if imagePath == '':
+            return []
+        # a stale ImagePath would only make the viewer fail: try the next search term instead
+        if not os.path.isfile(imagePath):
+            log.debug("scraped image %s not found", imagePath)
+            return []
+        return [imagePath]
+
+    def _getMediaForGlobPattern(
+        self,
+        pattern: str,
+        fieldNames: Tuple[str, ...],
+        _evParams: EventParams,
+        patternFields: Dict[str, str],
+        listings: DirectoryListings
+    ) -> SlideshowMediaSet:
+        """Search function for search terms defined in `_GLOB_PATTERNS`
+            :param pattern: the search term's glob pattern
+            :param fieldNames: names of the fields used in `pattern`
+            :param patternFields: glob pattern field values from `_getPatternFields()`
+            :param listings: directory listings already read while handling this event
+            :return: list of paths to media files matching the pattern, or []
+        """
+        # skip the search if a field is empty (e.g. event has no Publisher): the pattern
+        # could only match hidden files, so don't read the directory
+        for fieldName in fieldNames:
+            if not patternFields[fieldName]:
+                log.debug("skipped pattern %s: %s is empty", pattern, fieldName)
+                return []
         # insert event params into search term's glob pattern
-        globPattern: str = self._GLOB_PATTERNS[searchTerm].format(
-            gameBasename=gameBasename,
-            systemId=evParams.get('SystemId', '').lower(),
-            publisher=evParams.get('Publisher', '').lower(),
-            genre=evParams.get('Genre', '').lower(),
-        )
-        log.debug("searchTerm=%s globPattern=%s", searchTerm, globPattern)
+        globPattern: str = pattern.format_map(patternFields)
         # return media files matching this glob pattern, if any
-        return self._getMediaMatching(globPattern)
+        return self._getMediaMatching(globPattern, listings)
 
     def getMedia(self, evParams: EventParams) -> SlideshowMediaSet:
         """Locate media files to display for given action using search
@@ -333,18 +935,21 @@ class MediaManager:
         log.debug("params=%s", evParams)
         # get search precedence rule for this action
         action: str = evParams.get('Action', '')
-        precedenceRule: List[str] = self._getPrecedenceRule(action)
+        precedenceRule: Tuple[CompiledSearchTerm, ...] = self._getCompiledRule(action)
+        # look up event params used in glob patterns once for all search terms
+        patternFields: Dict[str, str] = self._getPatternFields(evParams)
+        # share directory listings between search terms so each directory is read only once
+        listings: DirectoryListings = {}
         # find best matching media files for system/game, trying each search term of precedence
         # rule in turn
         for searchTerm in precedenceRule:
             # if search term is `blank`, return empty list to indicate a blanked display
-            if searchTerm == 'blank':
+            if not searchTerm:
                 return []
-            # split complex terms e.g. `rom+scraped+publisher` into subterms
-            # combine all found media into a single list
+            # combine all media found for subterms of complex terms into a single list
             files: SlideshowMediaSet = []
-            for subTerm in searchTerm.split('+'):
-                subTermFiles = self._getMediaForSearchTerm(subTerm, evParams)
+            for subTerm, searchFunction in searchTerm:
+                subTermFiles = searchFunction(evParams, patternFields, listings)
                 log.debug("subTerm=%s subTermFiles=%s", subTerm, subTermFiles)
                 files += subTermFiles
             # if matching files were found for this term, return them
@@ -352,10 +957,7 @@ class MediaManager:
                 return files
         # if no matching files were found for any search term, return the default image as a
         # last resort
-        return [
-            f"{config.get(self._CONFIG_SECTION, 'media_path')}/"
-            f"{config.get(self._CONFIG_SECTION, 'default_image')}"
-        ]
+        return [self._defaultImagePath]
 
     def getStartupMedia(self) -> SlideshowMediaSet:
         """Get list of media files to be played at program startup"""
@@ -364,16 +966,239 @@ class MediaManager:
         return self._getMediaMatching(globPattern)
 
 
+class IPCPlayer:
+    """A long-running media player controlled via a JSON IPC socket
+        (e.g. mpv's `--input-ipc-server` option).
+
+        The player is launched once and told to switch media with `loadfile` commands,
+        avoiding the cost of launching a new player process for every media file.
+
+        Usage:
+        ```
+        if start():
+            play(filePath)
+            stop()
+        terminate()
+        ```
+    """
+
+    _connectTimeout: ClassVar[float] = 5.0
+    "how long to wait for the player to create its IPC socket (seconds)"
+
+    _terminateTimeout: ClassVar[float] = 3.0
+    "how long to wait for the player to exit after being asked to quit (seconds)"
+
+    def __init__(self, cmd: List[str], socketPath: str, onFinish: Callable[[], None]):
+        """:param cmd: sequence of program arguments to launch the player
+            :param socketPath: path to the player's IPC socket
+            :param onFinish: called when a media file finishes playing
+        """
+        self._cmd: List[str] = cmd
+        self._socketPath: str = socketPath
+        self._onFinish: Callable[[], None] = onFinish
+        self._process: Optional[subprocess.Popen] = None
+        "media player subprocess"
+        self._socket: Optional[socket.socket] = None
+        "connection to media player's IPC socket"
+        self._readerThread: Optional[Thread] = None
+        "thread reading events from IPC socket"
+        self._currentFile: Optional[str] = None
+        "media file currently loaded in player, or None if stopped or finished"
+        self._loadLock: Lock = Lock()
+        "guards tracking of the loaded file, which is shared with the IPC reader thread"
+        self._lastRequestId: int = 0
+        "request id of the last `loadfile` command sent"
+        self._loadRequestId: Optional[int] = None
+        "request id of the last `loadfile` command until the player replies, otherwise None"
+        self._playlistEntryId: Optional[int] = None
+        "player's playlist entry id for the file last loaded, or None if not known"
+
+    def start(self) -> bool:
+        """Launch media player and connect to its IPC socket
+            :return: True if player launched and connected successfully, False otherwise
+        """
+        # remove stale socket left behind by a previous player
+        try:
+            os.remove(self._socketPath)
+        except FileNotFoundError:
+            pass
+        except OSError as err:
+            log.error("failed to remove stale IPC socket %s: %s", self._socketPath, err)
+            return False
+        try:
+            self._process = subprocess.Popen( # pylint: disable=consider-using-with
+                self._cmd,
+                close_fds=False
+            )
+        except OSError as err:
+            log.error("failed to run %s: %s", self._cmd, err)
+            return False
+        log.debug("cmd=%s pid=%d", self._cmd, self._process.pid)
+        # wait for player to create its IPC socket
+        deadline: float = time.monotonic() + self._connectTimeout
+        while self._process.poll() is None and time.monotonic() < deadline:
+            try:
+                self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                self._socket.connect(self._socketPath)
+                break
+            except OSError:
+                self._socket.close()
+                self._socket = None
+                time.sleep(0.1)
+        if self._socket is None:
+            log.error("failed to connect to media player IPC socket %s", self._socketPath)
+            self.terminate()
+            return False
+        log.info("connected to media player IPC socket %s", self._socketPath)
+        self._readerThread = Thread(
+            name='ipc_reader_thread',
+            target=self._readEvents,
+            daemon=True
+        )
+        self._readerThread.start()
+        return True
+
+    def isRunning(self) -> bool:
+        """Test if the media player is running and connected
+            :return: True if player is running, False otherwise
+        """
+        return (
+            self._socket is not None
+            and self._process is not None
+            and self._process.poll() is None
+        )
+
+    def _sendCommand(self, *command: str, requestId: Optional[int] = None) -> bool:
+        """Send a command to the media player
+            :param command: command name and arguments
+            :param requestId: id for the player to include in its reply (if any)
+            :return: True if command was sent, False otherwise
+        """
+        if self._socket is None:
+            return False
+        request: dict = {'command': command}
+        if requestId is not None:
+            request['request_id'] = requestId
+        try:
+            self._socket.sendall(json.dumps(request).encode('utf-8') + b'\n')
+            return True
+        except OSError as err:
+            log.error("failed to send command %s to media player: %s", command, err)
+            return False
+
+    def _readEvents(self):
+        """IPC reader thread: call `_onFinish` when a media file finishes playing.
+            Exits when the IPC socket is closed.
+        """
+        log.debug("IPC reader thread %s start", get_ident())
+        try:
+            with self._socket.makefile('rb') as reader:
+                for line in reader:
+                    try:
+                        message: dict = json.loads(line)
+                    except json.decoder.JSONDecodeError:
+                        continue
+                    if self._isFinished(message):
+                        log.debug("media player event=%s", message)
+                        self._onFinish()
+        except (OSError, ValueError):
+            # socket closed
+            pass
+        log.debug("IPC reader thread %s exit", get_ident())
+
+    def _isFinished(self, message: dict) -> bool:
+        """Track which playlist entry the last `loadfile` loaded, and test if a message from
+            the player reports that entry finished playing. An `end-file` event for the
+            previous file (e.g. a video which ended just as the next file was loaded)
+            is ignored.
+            :param message: a reply or event from the player
+            :return: True if the file last loaded has finished playing, False otherwise
+        """
+        event: Optional[str] = message.get('event')
+        entryId: Optional[int] = message.get('playlist_entry_id')
+        with self._loadLock:
+            if event is None:
+                requestId: Optional[int] = message.get('request_id')
+                if requestId is not None and requestId == self._loadRequestId:
+                    # reply to `loadfile`: mpv 0.34+ includes the new playlist entry id
+                    data: object = message.get('data')
+                    self._playlistEntryId = (
+                        data.get('playlist_entry_id') if isinstance(data, dict) else None
+                    )
+                    self._loadRequestId = None
+                return False
+            if event == 'start-file':
+                # older players don't reply with the entry id: take it from the first
+                # file started after the reply
+                if self._loadRequestId is None and self._playlistEntryId is None:
+                    self._playlistEntryId = entryId
+                return False
+            # `end-file` with reason `stop` occurs when we change or stop media
+            if event != 'end-file' or message.get('reason') == 'stop':
+                return False
+            if self._loadRequestId is not None or entryId != self._playlistEntryId:
+                log.debug("ignored end-file event for previous media file: %s", message)
+                return False
+            self._currentFile = None
+            return True
+
+    def play(self, filePath: str, restart: bool = True) -> bool:
+        """Tell media player to play a media file, replacing any currently playing
+            :param filePath: full path to media file
+            :param restart: if False and filePath is still showing, leave it showing
+              rather than loading it again
+            :return: True if command was sent (or not needed), False otherwise
+        """
+        if not restart and filePath == self._currentFile:
+            log.debug("already showing %s", filePath)
+            return True
+        log.debug("loadfile %s", filePath)
+        with self._loadLock:
+            self._currentFile = filePath
+            self._lastRequestId += 1
+            self._loadRequestId = self._lastRequestId
+            self._playlistEntryId = None
+            requestId: int = self._loadRequestId
+        return self._sendCommand('loadfile', filePath, requestId=requestId)
+
+    def stop(self) -> bool:
+        """Tell media player to stop playback and go idle
+            :return: True if command was sent, False otherwise
+        """
+        with self._loadLock:
+            self._currentFile = None
+            self._loadRequestId = None
+            self._playlistEntryId = None
+        return self._sendCommand('stop')
+
+    def terminate(self):
+        """Ask media player to quit, terminating it if it does not exit in time"""
+        self._sendCommand('quit')
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+        if self._process is not None:
+            try:
+                _waitForProcess(self._process, self._terminateTimeout)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+                log.warning(
+                    "media player pid=%d did not quit within %ds: sent SIGKILL",
+                    self._process.pid, self._terminateTimeout
+                )
+            self._process = None
+
+
 class Slideshow:
     """Displays slideshow of images/videos on the marquee.
-        Uses 2 threads:
-        1. _queueReaderThread: watches queue for new media & dispatches slideshow thread
-        2. _slideshowThread: runs slideshow in continuous loop; waits for a media change event
-           before exiting
+        Uses a single long-lived thread, _slideshowThread, which runs the slideshow for the
+        current media set in a continuous loop until a media change event occurs, then picks
+        up the new media set.
 
         Call `setMedia()` to change the media set displayed.
 
-        Call  `stop()` to stop queue reader thread cleanly before exit.
+        Call  `stop()` to stop slideshow thread cleanly before exit.
     """
 
     _CONFIG_SECTION: Final[str] = 'slideshow'
@@ -382,53 +1207,8 @@ class Slideshow:
     _subProcessTimeout: ClassVar[float] = 3.0
     "how long to wait for a subprocess to complete or terminate"
 
-    class WaitableEvent:
-        """Provides an abstract object that can be used to resume select loops with
-        indefinite waits from another thread or process. Mimics the standard
-        threading.Event interface.
-
-        Code by Radek Lát: see https://lat.sk/2015/02/multiple-event-waiting-python-3/
-        """
-
-        def __init__(self):
-            # create a pipe between read & write file descriptors
-            self._readFD: int
-            self._writeFd: int
-            self._readFd, self._writeFd = os.pipe()
-
-        def wait(self, timeout=None) -> bool:
-            """Wait for event to occur (max timeout ms).
-                @return bool True if event has occurred before timeout
-            """
-            rfds, _wfds, _efds = select.select([self._readFd], [], [], timeout)
-            return self._readFd in rfds
-
-        def is_set(self) -> bool: # pylint: disable = invalid-name
-            """Test if event flag is set"""
-            return self.wait(0)
-
-        def clear(self) -> None:
-            """Clear event flag"""
-            if self.is_set():
-                os.read(self._readFd, 1)
-
-        def set(self) -> None:
-            """Set event flag"""
-            if not self.is_set():
-                os.write(self._writeFd, b'1')
-
-        def fileno(self) -> int:
-            """Return the FD number of the read side of the pipe; allows this object to
-            be used with select.select().
-            """
-            return self._readFd
-
-        def __del__(self):
-            os.close(self._readFd)
-            os.close(self._writeFd)
-
     def __init__(self):
-        """Initialise slideshow object and start queue reader thread.
+        """Initialise slideshow object and start slideshow thread.
             Run framebuffer resolution set command if defined in config file.
         """
 
@@ -446,30 +1226,59 @@ class Slideshow:
         "maximum time to let video file play before being stopped (seconds)"
         self._shuffleMedia: bool = config.getboolean(self._CONFIG_SECTION, 'shuffle', fallback=True)
         "if True show media files in a random order; if False, show in filename sort order"
+        self._random: random.Random = random.Random()
+        "random number generator used only by slideshow thread to shuffle media"
+        self._timeBetweenSlides: float = config.getfloat(
+            self._CONFIG_SECTION,
+            'time_between_slides'
+        )
+        "pause between slideshow images/clips (seconds)"
+        self._terminateViewer: bool = config.getboolean(self._CONFIG_SECTION, 'terminate_viewer')
+        "if True terminate image viewer after each image is shown"
+        # commands used to display media: parsed once here rather than for every media file
+        self._viewerCmd: List[str] = self._getCmdTemplate(
+            config.get(self._CONFIG_SECTION, 'viewer'),
+            config.get(self._CONFIG_SECTION, 'viewer_opts')
+        )
+        "image viewer command template"
+        self._clearCmd: List[str] = self._getCmdTemplate(
+            config.get(self._CONFIG_SECTION, 'clear_cmd'),
+            config.get(self._CONFIG_SECTION, 'clear_cmd_opts')
+        ) if config.get(self._CONFIG_SECTION, 'clear_cmd') else []
+        "clear image command template, or [] if not defined"
+        self._videoPlayerCmd: List[str] = self._getCmdTemplate(
+            config.get(self._CONFIG_SECTION, 'video_player'),
+            config.get(self._CONFIG_SECTION, 'video_player_opts')
+        )
+        "video player command template"
 
         # properties for communication between threads
-        self._queue: SimpleQueue[SlideshowMediaSet] = SimpleQueue()
-        "queue of slideshow media sets"
+        self._mediaLock: Lock = Lock()
+        "lock protecting `_pendingMedia`, `_requestedMedia` & setting/clearing `_mediaChange`"
+        self._pendingMedia: Optional[SlideshowMediaSet] = None
+        "media set waiting to be picked up by slideshow thread, or None"
+        self._requestedMedia: SlideshowMediaSet = []
+        "the media set most recently passed to `setMedia()`"
         self._currentMedia: SlideshowMediaSet = []
         "the media set currently displayed"
-        self._mediaChange: Event = self.WaitableEvent()
+        self._mediaChange: Event = WaitableEvent()
         "event to indicate slideshow media is to be changed"
-        self._videoFinish: Event = self.WaitableEvent()
+        self._videoFinish: Event = WaitableEvent()
         "event to indicate video file has finished playing"
 
         # threads & subprocesses
-        self._slideshowThread: Optional[Thread] = None
-        "slideshow worker thread"
-        self._queueReaderThread: Thread = Thread(
-            name='queue_reader_thread',
-            target=self._readMediaQueue,
+        self._slideshowThread: Thread = Thread(
+            name='slideshow_thread',
+            target=self._runSlideshows,
             daemon=True
         )
-        "media queue reader thread"
+        "slideshow worker thread"
         self._subProcess: Optional[subprocess.Popen] = None
         "media player/viewer subprocess"
         self._videoThread: Optional[Thread] = None
         "video player thread"
+        self._ipcPlayer: Optional[IPCPlayer] = None
+        "long-running media player controlled via IPC socket (if enabled in config file)"
 
         # handle program exit cleanly
         self._exitSignalled: Event = Event()
@@ -479,19 +1288,43 @@ class Slideshow:
 
         # set initial framebuffer resolution if set in config file
         self._setFramebufferResolution()
-        # start queue reader thread
-        self._queueReaderThread.start()
+        # launch long-running media player if IPC socket set in config file
+        self._startIPCPlayer()
 
         # selector to monitor both _mediaChange & _videoFinish events at same time
         self._selector: selectors.BaseSelector = selectors.DefaultSelector()  # create selector
         self._selector.register(self._mediaChange, selectors.EVENT_READ, "_mediaChange")
         self._selector.register(self._videoFinish, selectors.EVENT_READ, "_videoFinish")
 
+        # start slideshow thread
+        self._slideshowThread.start()
+
     def __del__(self):
         self.stop()
         # de-register from signal handler
         _signalHander.removeEvent(self._exitSignalled)
 
+    def _startIPCPlayer(self):
+        """Launch a long-running media player controlled via an IPC socket if `ipc_socket`
+            is defined in config file. The player shows both images and videos.
+            Falls back to launching a viewer or player for each media file if the player
+            fails to start.
+        """
+        ipcSocket: str = config.get(self._CONFIG_SECTION, 'ipc_socket', fallback='')
+        if not ipcSocket:
+            return
+        cmd: List[str] = self._getCmdList(
+            self._getCmdTemplate(
+                config.get(self._CONFIG_SECTION, 'ipc_player'),
+                config.get(self._CONFIG_SECTION, 'ipc_player_opts')
+            ),
+            socket=ipcSocket
+        )
+        self._ipcPlayer = IPCPlayer(cmd, ipcSocket, onFinish=self._videoFinish.set)
+        if not self._ipcPlayer.start():
+            log.warning("IPC media player failed to start: launching player for each file")
+            self._ipcPlayer = None
+
     def _setFramebufferResolution(self):
         """Set a specific framebuffer resolution if defined in config file"""
         fbResCmd: str = config.get(
@@ -509,23 +1342,32 @@ class Slideshow:
                     )
 
     @classmethod
-    def _getCmdList(cls, cmd: str, cmdOpts: str, **varsubs) -> List[str]:
-        """Convert command and option strings to a list for passing to subprocess.Popen
-            Substitute variables in the string with values supplied as keyword args.
+    def _getCmdTemplate(cls, cmd: str, cmdOpts: str) -> List[str]:
+        """Convert command and option strings to a command template: a list of command args
+            which may contain `{variable}` placeholders to be filled in by `_getCmdList()`
             :param cmd: path to external command
             :param cmdOpts: options to pass to command
+            :return: sequence of command args
+        """
+        # Popen only uses posix_spawn() if the executable is given as a path
+        # (see `_runCmd()`): look up commands given without a directory on PATH
+        if cmd and os.sep not in cmd:
+            cmd = shutil.which(cmd) or cmd
+        # check once at startup rather than failing to launch every media file
+        if cmd and not os.access(cmd, os.X_OK):
+            log.warning("command %s not found or not executable: check config file", cmd)
+        # split option string into components keeping quoted strings intact
+        return [cmd] + [opt.strip('"') for opt in re.findall(r'[^"\s]\S*|".+?"', cmdOpts)]
+
+    @classmethod
+    def _getCmdList(cls, cmdTemplate: List[str], **varsubs) -> List[str]:
+        """Substitute variables in a command template with values supplied as keyword args.
+            As the template is already split into args, substituted values may contain spaces.
+            :param cmdTemplate: command template from `_getCmdTemplate()`
             :param varsubs: variable substitutions: format variable=value
             :return: sequence of command args for passing to subprocess.Popen
         """
-        # enclose 'file' value in quotes (if present) to support filenames containing spaces
-        if "file" in varsubs:
-            varsubs["file"] = f'"{varsubs["file"]}"'
-        cmd = cmd.format(**varsubs)
-        cmdOpts = cmdOpts.format(**varsubs)
-        # split option string into components keeping quoted strings intact
-        cmdList: List[str] = [cmd] + [
-            opt.strip('"') for opt in re.findall(r'[^"\s]\S*|".+?"', cmdOpts)
-        ]
+        cmdList: List[str] = [arg.format_map(varsubs) for arg in cmdTemplate]
         log.debug("cmdList=%s", cmdList)
         return cmdList
 
@@ -537,8 +1379,14 @@ class Slideshow:
         """
         try:
             # Note: using with block causes stop() method to hang
-            # for 60s at _queueReaderThread.join() call
-            self._subProcess = subprocess.Popen(cmd) # pylint: disable=consider-using-with
+            # for 60s at _slideshowThread.join() call
+            # Python creates all file descriptors as non-inheritable so there is no need to
+            # close them in the child: close_fds=False lets Popen use posix_spawn() (vfork)
+            # instead of fork() + exec(), avoiding copying the parent's page tables
+            self._subProcess = subprocess.Popen( # pylint: disable=consider-using-with
+                cmd,
+                close_fds=False
+            )
             log.debug("cmd=%s pid=%d waitForExit=%s", cmd, self._subProcess.pid, waitForExit)
             if waitForExit:
                 rc: int = self._subProcess.wait()
@@ -549,36 +1397,29 @@ class Slideshow:
             return False
 
     def _showImage(self, imgPath: str):
-        """Run the display image command defined in config file
+        """Run the display image command defined in config file,
+            or tell the IPC media player to show the image if enabled
             :param imgPath: full path to image file
         """
-        cmd: List[str] = self._getCmdList(
-            config.get(self._CONFIG_SECTION, 'viewer'),
-            config.get(self._CONFIG_SECTION, 'viewer_opts'),
-            file=imgPath
-        )
+        if self._ipcPlayer is not None:
+            # don't reload image if it is still showing e.g. first image of new slideshow
+            # is the last image shown
+            self._ipcPlayer.play(imgPath, restart=False)
+            return
+        cmd: List[str] = self._getCmdList(self._viewerCmd, file=imgPath)
         self._runCmd(cmd)
 
     def _clearImage(self):
         """Run the clear image command defined in config file (if any)"""
-        clearCmd: str = config.get(self._CONFIG_SECTION, 'clear_cmd')
-        if clearCmd:
-            cmd: List[str] = self._getCmdList(
-                clearCmd,
-                config.get(self._CONFIG_SECTION, 'clear_cmd_opts')
-            )
-            self._runCmd(cmd, waitForExit=True)
+        if self._clearCmd:
+            self._runCmd(self._getCmdList(self._clearCmd), waitForExit=True)
 
     def _startVideo(self, videoPath: str):
         """Launch video player command defined in config file.
             To stop video, call `_stopVideo()` to terminate video player process.
             :param videoPath: full path to video file
         """
-        cmd: List[str] = self._getCmdList(
-            config.get(self._CONFIG_SECTION, 'video_player'),
-            config.get(self._CONFIG_SECTION, 'video_player_opts'),
-            file=videoPath
-        )
+        cmd: List[str] = self._getCmdList(self._videoPlayerCmd, file=videoPath)
         self._videoFinish.clear()
         self._runCmd(cmd, waitForExit=True)
         # fire _videoFinish event
@@ -588,10 +1429,17 @@ class Slideshow:
         """Stop running media player (if running) by terminating process"""
         if self._subProcess is not None:
             pid: int = self._subProcess.pid
+            # nothing to do if subprocess has already exited (e.g. video played to the end):
+            # poll() reaps it without blocking
+            if self._subProcess.poll() is not None:
+                log.debug(
+                    "media player pid=%d already exited rc=%d", pid, self._subProcess.returncode
+                )
+                return
             # try to terminate subprocess cleanly
             self._subProcess.terminate()
             try:
-                rc: int = self._subProcess.wait(self._subProcessTimeout)
+                rc: int = _waitForProcess(self._subProcess, self._subProcessTimeout)
                 log.debug("terminated media player pid=%d rc=%d", pid, rc)
             except subprocess.TimeoutExpired:
                 # subprocess did not exit within timeout so kill it
@@ -600,6 +1448,8 @@ class Slideshow:
                     "media player subprocess pid=%d did not terminate within %ds: sent SIGKILL",
                     pid, self._subProcessTimeout
                 )
+                # reap killed process so it doesn't linger as a zombie
+                self._subProcess.wait()
 
     def _getMediaPaths(self) -> SlideshowMediaSet:
         """Get list of media paths from the `_currentMedia` property.
@@ -613,19 +1463,20 @@ class Slideshow:
             """
             return PurePath(path).stem.lower()
 
-        mediaPaths: SlideshowMediaSet = self._currentMedia.copy()
-        # if shuffle config option on, randomise order of media
+        # nothing to reorder for a single media file e.g. default image
+        if len(self._currentMedia) <= 1:
+            return self._currentMedia.copy()
+        # if shuffle config option on, randomise order of media:
+        # sample() returns a new list so `_currentMedia` is never modified
         if self._shuffleMedia:
-            random.shuffle(mediaPaths)
+            return self._random.sample(self._currentMedia, len(self._currentMedia))
         # otherwise sort list by file stem (case insensitive)
-        else:
-            mediaPaths.sort(key=fileStem)
-        return mediaPaths
+        return sorted(self._currentMedia, key=fileStem)
 
     def _runSlideshow(self):
-        """Slideshow thread: loop a slideshow media set until a `_mediaChange` event occurs.
+        """Loop a slideshow of the current media set until a `_mediaChange` event occurs.
         """
-        log.debug("slideshow worker thread %s start", get_ident())
+        log.debug("slideshow start: %s", self._currentMedia)
         while not self._mediaChange.is_set():
             # fetch list of media each time through slideshow in case we need to shuffle
             mediaPaths: SlideshowMediaSet = self._getMediaPaths()
@@ -634,18 +1485,29 @@ class Slideshow:
                 if MediaManager.isVideo(mediaFile):
                     # start video, wait for clip to finish or `_maxVideoTime` to expire
                     #  or _mediaChange event to occur, then stop it
-                    self._videoThread = Thread(
-                        name="video_thread",
-                        target=self._startVideo,
-                        args=(mediaFile,),
-                        daemon=True
-                    )
-                    self._videoThread.start()
+                    if self._ipcPlayer is not None:
+                        self._videoFinish.clear()
+                        self._ipcPlayer.play(mediaFile)
+                    else:
+                        self._videoThread = Thread(
+                            name="video_thread",
+                            target=self._startVideo,
+                            args=(mediaFile,),
+                            daemon=True
+                        )
+                        self._videoThread.start()
                     log.debug("showing video for up to %ds", self._maxVideoTime)
-                    self._selector.select(timeout=self._maxVideoTime)
-                    # if events is None after select() call, it timed out
-                    self._stopSubProcess()
-                    self._clearImage()
+                    events: List[Tuple[selectors.SelectorKey, int]] = self._selector.select(
+                        timeout=self._maxVideoTime
+                    )
+                    if self._ipcPlayer is not None:
+                        # if no events after select() call, it timed out: stop the video
+                        # (otherwise IPC media player switches straight to next file)
+                        if not events:
+                            self._ipcPlayer.stop()
+                    else:
+                        self._stopSubProcess()
+                        self._clearImage()
                 else:
                     # show image, wait for `_imgDisplayTime` to expire or _mediaChange event,
                     # then clear it
@@ -660,98 +1522,94 @@ class Slideshow:
                         # leave image showing for configured time
                         self._mediaChange.wait(timeout=self._imgDisplayTime)
                         log.debug("showing image for up to %ds", self._imgDisplayTime)
-                    # terminate image viewer if option set in config file
-                    if config.getboolean(self._CONFIG_SECTION, 'terminate_viewer'):
-                        self._stopSubProcess()
-                    self._clearImage()
+                    if self._ipcPlayer is None:
+                        # terminate image viewer if option set in config file
+                        if self._terminateViewer:
+                            self._stopSubProcess()
+                        self._clearImage()
                 # exit slideshow if _mediaChangeRequested flag set
                 if self._mediaChange.is_set():
                     log.debug("_mediaChange event occurred")
                     break
                 # pause between slideshow images/clips
-                self._mediaChange.wait(
-                    timeout=config.getfloat(self._CONFIG_SECTION, 'time_between_slides')
-                )
+                self._mediaChange.wait(timeout=self._timeBetweenSlides)
         # slideshow loop interrupted by _mediaChange event
-        log.debug("slideshow worker thread %s exit", get_ident())
+        log.debug("slideshow exit")
 
-    def _readMediaQueue(self):
-        """Media queue reader thread: read media sets from the media queue
-            and launch slideshow thread to display them.
+    def _runSlideshows(self):
+        """Slideshow thread: run a slideshow of the current media set until a `_mediaChange`
+            event occurs, then pick up the new media set from `setMedia()` and start again.
             Exit on `_exitSignalled` event.
 
-            Sends `_mediaChange` event when a new media set is queued.
+            Runs slideshows in this thread rather than starting a new thread for each media set.
         """
-        log.debug("media queue reader thread %s start", get_ident())
+        log.debug("slideshow thread %s start", get_ident())
         while not self._exitSignalled.is_set():
-            log.debug("wait for slideshow media set")
-            mediaPaths: SlideshowMediaSet = self._queue.get(block=True)
-            # TODO: if qsize > 1, jump to end of queue? But may cause a deadlock?
-
-            # Check for exit signal before launching a slideshow:
-            # this allows stop() to enqueue an empty media set to cause exit
+            if self._currentMedia:
+                # returns when _mediaChange event occurs
+                self._runSlideshow()
+            else:
+                log.debug("wait for slideshow media set")
+                self._mediaChange.wait()
+            # collect new media set, clearing _mediaChange event at the same time:
+            # only the latest media set matters if several were set meanwhile
+            mediaPaths: Optional[SlideshowMediaSet]
+            with self._mediaLock:
+                self._mediaChange.clear()
+                mediaPaths, self._pendingMedia = self._pendingMedia, None
+            # Check for exit signal before changing slideshow:
+            # this allows stop() to signal a media change to cause exit
             if self._exitSignalled.is_set():
                 break
-            # only change slideshow if new media set is different
-            mediaChanged: bool = mediaPaths != self._currentMedia
-            log.debug(
-                "media changed=%s mediaPaths=%s _currentMedia=%s",
-                mediaChanged, mediaPaths, self._currentMedia
-            )
-            if mediaChanged:
-                # signal a media change and wait for current slideshow (if any) to exit
-                log.info("slideshow media changed: %s", mediaPaths)
-                self._mediaChange.set()
-                if self._slideshowThread is not None:
-                    log.debug(
-                        "waiting for _slideshowThread=%s to exit",
-                        self._slideshowThread.ident
-                    )
-                    self._slideshowThread.join()
-                # record current media set
-                self._currentMedia = mediaPaths
-                self._mediaChange.clear()
-                # start new slideshow unless blanked display requested
-                if mediaPaths:
-                    self._slideshowThread = Thread(
-                        name='slideshow_thread',
-                        target=self._runSlideshow,
-                    )
-                    self._slideshowThread.start()
-                else:
-                    # Note: should only happen if 'blank' specified in search precedence rule;
-                    # MediaManager.getMedia() always returns default image as last resort
-                    log.info("'blank' specified in search precedence rule: blanking display")
-        # queue reader loop interrupted by stop() or _exitSignalled event
-        log.debug("media queue reader thread %d exit", get_ident())
+            if mediaPaths is None:
+                continue
+            log.info("slideshow media changed: %s", mediaPaths)
+            self._currentMedia = mediaPaths
+            if not mediaPaths:
+                # Note: should only happen if 'blank' specified in search precedence rule;
+                # MediaManager.getMedia() always returns default image as last resort
+                log.info("'blank' specified in search precedence rule: blanking display")
+                if self._ipcPlayer is not None:
+                    self._ipcPlayer.stop()
+        # slideshow thread loop interrupted by stop() or _exitSignalled event
+        log.debug("slideshow thread %d exit", get_ident())
 
     def setMedia(self, mediaPaths: SlideshowMediaSet):
-        """Queue a media set for display.
+        """Change the media set displayed. Has no effect if the media set is unchanged.
             :param mediaPaths: list of media files to be displayed as a slideshow.
-              Duplicates are removed before queueing.
+              Duplicates are removed.
         """
         # Normalise media set: remove duplicates and sort
-        # (allows queue reader to check if media set has changed)
+        # (allows check if media set has changed)
         mediaPaths = list(set(mediaPaths))
         mediaPaths.sort()
-        self._queue.put(mediaPaths)
+        with self._mediaLock:
+            mediaChanged: bool = mediaPaths != self._requestedMedia
+            log.debug(
+                "media changed=%s mediaPaths=%s _requestedMedia=%s",
+                mediaChanged, mediaPaths, self._requestedMedia
+            )
+            if mediaChanged:
+                # signal a media change: slideshow thread picks up new media set
+                self._requestedMedia = self._pendingMedia = mediaPaths
+                self._mediaChange.set()
 
     def stop(self):
-        """Stop the slideshow and clear the display; also stops queue reader thread."""
+        """Stop the slideshow and clear the display; also stops slideshow thread."""
         log.debug("slideshow stop requested")
-        # signal any running slideshow thread to exit & wait until it does
-        self._mediaChange.set()
-        if (self._slideshowThread is not None) and self._slideshowThread.is_alive():
+        # signal slideshow thread to exit & wait until it does
+        self._exitSignalled.set()
+        with self._mediaLock:
+            self._mediaChange.set()
+        if self._slideshowThread.is_alive():
             log.debug("waiting for slideshow thread to exit: %s", self._slideshowThread)
             self._slideshowThread.join()
-        # Signal queue reader thread to exit and wait until it does.
-        # Enqueue an empty slideshow to cause queue reader thread to check
-        # _exitSignalled event status
-        self._exitSignalled.set()
-        self.setMedia([])
-        log.debug("waiting for queue reader thread to exit: %s", self._queueReaderThread)
-        self._queueReaderThread.join()
-        log.debug("remaining threads: %s", enumerate_threads())
+        # close long-running media player
+        if self._ipcPlayer is not None:
+            self._ipcPlayer.terminate()
+            self._ipcPlayer = None
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("remaining threads: %s", enumerate_threads())
 
 
 class EventHandler:
@@ -767,6 +1625,17 @@ class EventHandler:
     _CONFIG_SECTION_CHANGE: Final[str] = 'change'
     "config file section for marquee change settings"
 
+    _STATE_SIGNIFICANT_ACTIONS: Final[FrozenSet[str]] = frozenset(['endgame', 'sleep', 'wakeup'])
+    "actions which affect how later events are handled, so can't simply be dropped"
+
+    _STATE_CHANGE_KEYS: Final[Dict[str, Callable[..., object]]] = {
+        'action': attrgetter('action'),
+        'system': attrgetter('system'),
+        'game': attrgetter('game'),
+        'system/game': attrgetter('system', 'game'),
+    }
+    "maps each comparing state change rule to the part of the ES state it compares"
+
     # type alias
     ChangeRuleSet = Dict[str, str]
 
@@ -801,6 +1670,8 @@ class EventHandler:
         "current EmulationStation state"
         self._previousEvParams: EventParams = {}
         "event params from previous event"
+        self._lastEventKey: Optional[EventHandler.ESState] = None
+        "ES state from last event handled"
         # in case first event is 'sleep', initialise state before sleep
         self._stateBeforeSleep = self._currentState
         "EmulationStation state before last sleep action"
@@ -811,6 +1682,9 @@ class EventHandler:
             fallback=False
         )
         self._arcadeSystems: str = config.get(self._CONFIG_SECTION, 'arcade_systems', fallback='')
+        # look up state change rules once rather than walking config section for every event
+        self._stateChangeRules: EventHandler.ChangeRuleSet = self._getStateChangeRules()
+        "mapping from action to state change rule"
         log.debug(
             "_arcadeSystemEnabled=%s _arcadeSystems = %s",
             self._arcadeSystemEnabled, self._arcadeSystems
@@ -825,20 +1699,58 @@ class EventHandler:
                 self._slideshow.stop()
                 break
             log.debug("event received: %s", event)
+            # Coalesce events which queued up while the previous event was being handled
+            # e.g. when scrolling quickly through a game list: only handle the latest.
+            # The ES state file only holds params for the latest event anyway.
+            # Superseded events which affect how later events are handled (e.g. `endgame`
+            # just before `gamelistbrowsing`) still update the recorded state.
+            queuedEvents: List[str] = self._mqttSubscriber.getQueuedEvents()
+            if queuedEvents:
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("skipped superseded events: %s", [event] + queuedEvents[:-1])
+                for supersededEvent in [event] + queuedEvents[:-1]:
+                    self._applySupersededEvent(supersededEvent)
+                event = queuedEvents[-1]
             params: EventParams = self._mqttSubscriber.getEventParams()
             self._handleEvent(params)
 
+    def _applySupersededEvent(self, action: str):
+        """Update recorded state for an event superseded by a later event, without reading
+            the ES state file (which only holds the latest event's params) or changing media.
+            `endgame` makes the next event change the marquee, `sleep` records the state
+            before sleep and `wakeup` restores it; other actions are ignored.
+            :param action: action name from MQTT message
+        """
+        if action not in self._STATE_SIGNIFICANT_ACTIONS:
+            return
+        if action == 'sleep':
+            self._stateBeforeSleep = self._currentState
+            log.info("record _stateBeforeSleep=%s", self._stateBeforeSleep)
+        if action == 'wakeup':
+            self._currentState = self._stateBeforeSleep
+            log.info("restore _stateBeforeSleep=%s", self._stateBeforeSleep)
+        else:
+            self._currentState = replace(self._currentState, action=action)
+        # don't skip the next event as a repeat of the one before this
+        self._lastEventKey = None
+
     def _handleEvent(self, evParams: EventParams):
         """Find appropriate media files for the event and display them
             :param evParams: a dict of event parameters
         """
+        # skip repeated events: EmulationStation sometimes fires the same event again
+        # (compare all fields of the ES state, as used by `_hasStateChanged()`)
+        eventKey: EventHandler.ESState = EventHandler.ESState.fromEvent(evParams)
+        if eventKey == self._lastEventKey:
+            log.debug("skipped repeated event: %s", eventKey)
+            return
+        self._lastEventKey = eventKey
         # If arcade meta-system is enabled in config file, convert arcade systemIds to same value
         if self._arcadeSystemEnabled:
             evParams = self._convertArcadeSystems(evParams)
         log.info("event params=%s", evParams)
-        stateChangeRules: EventHandler.ChangeRuleSet = self._getStateChangeRules()
         # has EmulationStation state changed?
-        stateChanged: bool = self._hasStateChanged(evParams, stateChangeRules)
+        stateChanged: bool = self._hasStateChanged(evParams, self._stateChangeRules)
         # update state: on wakeup, restore state & evParams from before sleep
         evParams = self._updateState(evParams)
         if stateChanged:
@@ -915,15 +1827,16 @@ class EventHandler:
             :return: True if state has changed
         """
         newState: EventHandler.ESState = EventHandler.ESState.fromEvent(evParams)
-        log.debug("changeRules=%s", changeRules)
-        log.debug("_currentState=%s newState=%s", self._currentState, newState)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "changeRules=%s _currentState=%s newState=%s",
+                changeRules, self._currentState, newState
+            )
 
-        # 'wakeup' action always causes a state change as we restore the state before sleep
-        if newState.action == 'wakeup':
-            return True
+        # 'wakeup' action always causes a state change as we restore the state before sleep;
         # action after 'endgame' always causes a state change
         # (ensures action's search rules are acted on)
-        if self._currentState.action == 'endgame':
+        if newState.action == 'wakeup' or self._currentState.action == 'endgame':
             return True
         # Use rules defined in config file to determine if state has changed
         changeWhen: str = changeRules.get(newState.action, '')
@@ -934,21 +1847,10 @@ class EventHandler:
         # always change if `always` specified?
         if changeWhen == 'always':
             return True
-        # has action changed from previous action?
-        if changeWhen == 'action':
-            return not newState.action == self._currentState.action
-        # has system changed?
-        if changeWhen == 'system':
-            return not newState.system == self._currentState.system
-        # has game changed?
-        if changeWhen == 'game':
-            return not newState.game == self._currentState.game
-        # has system OR game changed?
-        if changeWhen == 'system/game':
-            return not (
-                (newState.system == self._currentState.system) and
-                (newState.game == self._currentState.game)
-            )
+        # has the action, system, game or system/game changed?
+        stateKey: Optional[Callable[..., object]] = self._STATE_CHANGE_KEYS.get(changeWhen)
+        if stateKey is not None:
+            return stateKey(newState) != stateKey(self._currentState)
         # unrecognised state change rule: log it
         log.error(
             "Unrecognised state change rule - check config file: "
@@ -969,7 +1871,7 @@ _signalHander: SignalHandler = SignalHandler()
 log: logging.Logger = getLogger()
 
 # Read module config file
-config: ConfigParser = _loadConfig()
+config: CachedConfigParser = _loadConfig()
 
 
 # --- main --- #